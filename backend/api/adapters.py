@@ -18,7 +18,7 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         """
         Override save_user to ensure email is properly added to allauth's EmailAddress model
         """
-        logger.info(f"CustomAccountAdapter.save_user called for {user.username}")
+        logger.info("CustomAccountAdapter.save_user called for %s", user.username)
 
         # Call parent to handle basic user saving
         user = super().save_user(request, user, form, commit=False)
@@ -26,7 +26,7 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         # User should be inactive until email is verified
         if self.is_email_verification_mandatory():
             user.is_active = False
-            logger.info(f"Setting user {user.username} as inactive (email verification required)")
+            logger.info("Setting user %s as inactive (email verification required)", user.username)
 
         if commit:
             user.save()
@@ -438,6 +438,9 @@ class Listing(models.Model):
 
 class ListingImage(models.Model):
     """Images for listings with multiple size variants in WebP format"""
+
+    SIZE_FIELDS = ('image_thumb', 'image_small', 'image_medium', 'image_large', 'image_xlarge')
+
     listing = models.ForeignKey(
         Listing,
         on_delete=models.CASCADE,
@@ -481,7 +484,7 @@ class ListingImage(models.Model):
     def delete(self, *args, **kwargs):
         """Delete all image files when model instance is deleted"""
         # Delete all size variant files
-        for field_name in ['image_thumb', 'image_small', 'image_medium', 'image_large', 'image_xlarge']:
+        for field_name in self.SIZE_FIELDS:
             image_field = getattr(self, field_name, None)
             if image_field and image_field.name:
                 image_field.delete(save=False)
@@ -697,6 +700,12 @@ class Announcement(models.Model):
             models.Index(fields=['province', 'municipality', '-created_at']),
             models.Index(fields=['priority', '-created_at']),
             models.Index(fields=['announcement_type']),
+            # Public list: active, unexpired announcements in a province
+            models.Index(
+                fields=['province', 'expiry_date'],
+                condition=models.Q(is_active=True),
+                name='ann_active_prov_exp_idx',
+            ),
         ]
 
     def __str__(self):
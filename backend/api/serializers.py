@@ -1,11 +1,109 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import BooleanField, Exists, OuterRef, Prefetch, Value
 from dj_rest_auth.registration.serializers import RegisterSerializer
 from .models import (
     Province, Municipality, Barangay, Category, Listing,
-    ListingImage, UserProfile, Favorite, Announcement
+    ListingImage, Favorite, Announcement
 )
-from .validators import ValidatedImageField
+from .validators import PhilippinePhoneField, ValidatedImageField
+
+
+def _active_municipalities(province):
+    """
+    Active municipalities of a province, from the `active_municipalities`
+    prefetch ProvinceViewSet sets up for detail views when available.
+    """
+    municipalities = getattr(province, 'active_municipalities', None)
+    if municipalities is None:
+        municipalities = province.municipalities.filter(active=True)
+    return municipalities
+
+
+def _active_municipality_count(province):
+    """
+    Number of active municipalities in a province.
+
+    ProvinceViewSet annotates `municipality_count` in SQL for lists and
+    prefetches `active_municipalities` for details; nested uses (e.g.
+    listing province_details) fall back to a COUNT query.
+    """
+    count = getattr(province, 'municipality_count', None)
+    if count is not None:
+        return count
+    municipalities = getattr(province, 'active_municipalities', None)
+    if municipalities is not None:
+        return len(municipalities)
+    return province.municipalities.filter(active=True).count()
+
+
+def _absolute_url(context, url):
+    """
+    Absolute form of a media `url` for the request in `context`.
+
+    request.build_absolute_uri() re-derives scheme and host on every call, and
+    image-heavy responses call it once per size variant. The base is computed
+    once and cached in the (shared) serializer context instead.
+    """
+    request = context.get('request')
+    if request is None:
+        return url
+    if not url.startswith('/') or url.startswith('//'):
+        # Already absolute (remote storage) or path-relative
+        return request.build_absolute_uri(url)
+    base = context.get('_absolute_url_base')
+    if base is None:
+        base = request.build_absolute_uri('/').rstrip('/')
+        context['_absolute_url_base'] = base
+    return base + url
+
+
+def _user_summary(user):
+    """
+    Contact details of a listing seller or announcement author.
+
+    A plain dict rather than a nested UserSerializer, which would be built
+    per response and look up email verification the page doesn't show.
+    """
+    profile = getattr(user, 'profile', None)
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'phone_number': profile.phone_number if profile else None,
+    }
+
+
+def _is_favorited(context, listing):
+    """
+    Whether the requesting user has favorited `listing`.
+
+    Listing views annotate `is_favorited` in SQL via annotate_is_favorited();
+    other callers (e.g. the create response) fall back to an EXISTS query.
+    """
+    favorited = getattr(listing, 'is_favorited', None)
+    if favorited is not None:
+        return favorited
+    request = context.get('request')
+    if request and request.user.is_authenticated:
+        return Favorite.objects.filter(
+            user=request.user,
+            listing=listing
+        ).exists()
+    return False
+
+
+class HeroImageURLMixin:
+    """Provides get_hero_image_url for serializers of models with a hero_image"""
+
+    def get_hero_image_url(self, obj):
+        name = obj.hero_image.name
+        if name:
+            return _absolute_url(self.context, obj.hero_image.storage.url(name))
+        return None
 
 
 class BarangaySerializer(serializers.ModelSerializer):
@@ -18,7 +116,7 @@ class BarangaySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug']
 
 
-class MunicipalitySerializer(serializers.ModelSerializer):
+class MunicipalitySerializer(HeroImageURLMixin, serializers.ModelSerializer):
     """Serializer for City/Municipality model"""
     province_name = serializers.CharField(source='province.name', read_only=True)
     hero_image_url = serializers.SerializerMethodField()
@@ -28,18 +126,10 @@ class MunicipalitySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'slug', 'psgc_code', 'province', 'province_name', 'type', 'active', 'hero_image_url']
         read_only_fields = ['id', 'slug']
 
-    def get_hero_image_url(self, obj):
-        if obj.hero_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.hero_image.url)
-            return obj.hero_image.url
-        return None
-
 
-class ProvinceSerializer(serializers.ModelSerializer):
+class ProvinceSerializer(HeroImageURLMixin, serializers.ModelSerializer):
     """Serializer for Province model with cities/municipalities"""
-    municipalities = MunicipalitySerializer(many=True, read_only=True)
+    municipalities = serializers.SerializerMethodField()
     municipality_count = serializers.SerializerMethodField()
     hero_image_url = serializers.SerializerMethodField()
 
@@ -51,19 +141,16 @@ class ProvinceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'slug']
 
-    def get_municipality_count(self, obj):
-        return obj.municipalities.filter(active=True).count()
+    def get_municipalities(self, obj):
+        return MunicipalitySerializer(
+            _active_municipalities(obj), many=True, context=self.context
+        ).data
 
-    def get_hero_image_url(self, obj):
-        if obj.hero_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.hero_image.url)
-            return obj.hero_image.url
-        return None
+    def get_municipality_count(self, obj):
+        return _active_municipality_count(obj)
 
 
-class ProvinceListSerializer(serializers.ModelSerializer):
+class ProvinceListSerializer(HeroImageURLMixin, serializers.ModelSerializer):
     """Simplified serializer for province lists (no cities/municipalities)"""
     municipality_count = serializers.SerializerMethodField()
     hero_image_url = serializers.SerializerMethodField()
@@ -73,15 +160,7 @@ class ProvinceListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'slug', 'psgc_code', 'municipality_count', 'hero_image_url']
 
     def get_municipality_count(self, obj):
-        return obj.municipalities.filter(active=True).count()
-
-    def get_hero_image_url(self, obj):
-        if obj.hero_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.hero_image.url)
-            return obj.hero_image.url
-        return None
+        return _active_municipality_count(obj)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -117,8 +196,9 @@ class PublicUserSerializer(serializers.ModelSerializer):
     profile_picture_medium = serializers.SerializerMethodField()
     bio = serializers.CharField(source='profile.bio', read_only=True, allow_null=True)
     verified = serializers.BooleanField(source='profile.verified', read_only=True)
-    listing_count = serializers.SerializerMethodField()
-    announcement_count = serializers.SerializerMethodField()
+    # Annotated by public_user_profile_view
+    listing_count = serializers.IntegerField(read_only=True)
+    announcement_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = User
@@ -135,10 +215,7 @@ class PublicUserSerializer(serializers.ModelSerializer):
         if hasattr(obj, 'profile'):
             image_field = getattr(obj.profile, field_name, None)
             if image_field and image_field.name:
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(image_field.url)
-                return image_field.url
+                return _absolute_url(self.context, image_field.url)
         return None
 
     def get_profile_picture(self, obj):
@@ -154,20 +231,12 @@ class PublicUserSerializer(serializers.ModelSerializer):
     def get_profile_picture_medium(self, obj):
         return self._get_profile_picture_url(obj, 'profile_picture_medium')
 
-    def get_listing_count(self, obj):
-        """Count active listings"""
-        return obj.listings.filter(status='active').count()
-
-    def get_announcement_count(self, obj):
-        """Count active announcements"""
-        return obj.announcements.filter(is_active=True).count()
-
 
 class CustomRegisterSerializer(RegisterSerializer):
     """Custom registration serializer for dj-rest-auth with additional fields"""
     first_name = serializers.CharField(required=True, max_length=150)
     last_name = serializers.CharField(required=True, max_length=150)
-    phone_number = serializers.CharField(required=False, allow_blank=True, max_length=20)
+    phone_number = PhilippinePhoneField(required=False, allow_blank=True)
 
     def __init__(self, *args, **kwargs):
         """Map password fields before initialization"""
@@ -181,26 +250,6 @@ class CustomRegisterSerializer(RegisterSerializer):
             kwargs['data'] = data
         super().__init__(*args, **kwargs)
 
-    def validate_phone_number(self, value):
-        """Validate and format Philippine phone numbers"""
-        if not value:
-            return value
-
-        # Remove spaces, dashes, and other common separators
-        cleaned = ''.join(filter(str.isdigit, value))
-
-        # Convert international format (63) to local format (0)
-        if cleaned.startswith('63') and len(cleaned) == 12:
-            cleaned = '0' + cleaned[2:]
-
-        # Validate format: must be 11 digits starting with 0
-        if cleaned and (len(cleaned) != 11 or not cleaned.startswith('0')):
-            raise serializers.ValidationError(
-                "Phone number must be 11 digits starting with 0 (e.g., 09681234567)"
-            )
-
-        return cleaned
-
     def get_cleaned_data(self):
         """Override to include custom fields in cleaned data"""
         data = super().get_cleaned_data()
@@ -211,49 +260,29 @@ class CustomRegisterSerializer(RegisterSerializer):
 
     def custom_signup(self, request, user):
         """Called after user is created to set additional fields"""
-        user.first_name = self.validated_data.get('first_name', '')
-        user.last_name = self.validated_data.get('last_name', '')
-        user.save()
-
-        # Create user profile with phone number
-        phone_number = self.validated_data.get('phone_number', '')
-        UserProfile.objects.get_or_create(
-            user=user,
-            defaults={'phone_number': phone_number}
-        )
+        with transaction.atomic():
+            user.first_name = self.validated_data.get('first_name', '')
+            user.last_name = self.validated_data.get('last_name', '')
+            user.save(update_fields=['first_name', 'last_name'])
+
+            # The profile was created with the user by the post_save signal
+            phone_number = self.validated_data.get('phone_number', '')
+            if phone_number:
+                user.profile.phone_number = phone_number
+                user.profile.save(update_fields=['phone_number'])
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
     password = serializers.CharField(write_only=True, min_length=8)
     password_confirm = serializers.CharField(write_only=True, min_length=8)
-    phone_number = serializers.CharField(required=False, allow_blank=True, max_length=20)
+    phone_number = PhilippinePhoneField(required=False, allow_blank=True)
 
     class Meta:
         model = User
         fields = ['username', 'email', 'password', 'password_confirm',
                   'first_name', 'last_name', 'phone_number']
 
-    def validate_phone_number(self, value):
-        """Validate and format Philippine phone numbers"""
-        if not value:
-            return value
-
-        # Remove spaces, dashes, and other common separators
-        cleaned = ''.join(filter(str.isdigit, value))
-
-        # Convert international format (63) to local format (0)
-        if cleaned.startswith('63') and len(cleaned) == 12:
-            cleaned = '0' + cleaned[2:]
-
-        # Validate format: must be 11 digits starting with 0
-        if cleaned and (len(cleaned) != 11 or not cleaned.startswith('0')):
-            raise serializers.ValidationError(
-                "Phone number must be 11 digits starting with 0 (e.g., 09681234567)"
-            )
-
-        return cleaned
-
     def validate(self, data):
         if data['password'] != data['password_confirm']:
             raise serializers.ValidationError(
@@ -266,64 +295,39 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('password_confirm')
         user = User.objects.create_user(**validated_data)
 
-        # Create user profile with phone number
-        UserProfile.objects.create(user=user, phone_number=phone_number)
+        # The profile was created with the user by the post_save signal
+        if phone_number:
+            user.profile.phone_number = phone_number
+            user.profile.save(update_fields=['phone_number'])
 
         return user
 
 
 class UserProfileUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating user profile"""
-    phone_number = serializers.CharField(
-        required=False,
-        allow_blank=True,
-        max_length=20
-    )
+    phone_number = PhilippinePhoneField(required=False, allow_blank=True)
 
     class Meta:
         model = User
         fields = ['first_name', 'last_name', 'email', 'phone_number']
 
-    def validate_phone_number(self, value):
-        """Validate and format Philippine phone numbers"""
-        if not value:
-            return value
-
-        # Remove spaces, dashes, and other common separators
-        cleaned = ''.join(filter(str.isdigit, value))
-
-        # Convert international format (63) to local format (0)
-        if cleaned.startswith('63') and len(cleaned) == 12:
-            cleaned = '0' + cleaned[2:]
-
-        # Validate format: must be 11 digits starting with 0
-        if cleaned and (len(cleaned) != 11 or not cleaned.startswith('0')):
-            raise serializers.ValidationError(
-                "Phone number must be 11 digits starting with 0"
-            )
-
-        return cleaned
-
     def update(self, instance, validated_data):
         phone_number = validated_data.pop('phone_number', None)
 
-        # Update user fields
-        instance.first_name = validated_data.get(
-            'first_name', instance.first_name
-        )
-        instance.last_name = validated_data.get(
-            'last_name', instance.last_name
-        )
-        instance.email = validated_data.get('email', instance.email)
-        instance.save()
+        # Update only the user fields that were submitted
+        update_fields = []
+        for field in ('first_name', 'last_name', 'email'):
+            if field in validated_data:
+                setattr(instance, field, validated_data[field])
+                update_fields.append(field)
+        if update_fields:
+            instance.save(update_fields=update_fields)
 
-        # Update or create profile with phone number
+        # Every user has a profile (created by the post_save signal)
         if phone_number is not None:
-            profile, created = UserProfile.objects.get_or_create(
-                user=instance
-            )
+            profile = instance.profile
             profile.phone_number = phone_number
-            profile.save()
+            profile.save(update_fields=['phone_number'])
 
         return instance
 
@@ -338,8 +342,12 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug']
 
     def get_subcategories(self, obj):
-        if obj.subcategories.exists():
-            return CategorySerializer(obj.subcategories.filter(active=True), many=True).data
+        # CategoryViewSet prefetches active children into `active_subcategories`
+        subcategories = getattr(obj, 'active_subcategories', None)
+        if subcategories is None:
+            subcategories = obj.subcategories.filter(active=True)
+        if subcategories:
+            return CategorySerializer(subcategories, many=True, context=self.context).data
         return []
 
 
@@ -371,12 +379,9 @@ class ListingImageSerializer(serializers.ModelSerializer):
 
     def _get_image_url(self, obj, field_name):
         """Helper to get absolute URL for an image field"""
-        request = self.context.get('request')
         image_field = getattr(obj, field_name, None)
         if image_field and hasattr(image_field, 'url') and image_field.name:
-            if request is not None:
-                return request.build_absolute_uri(image_field.url)
-            return image_field.url
+            return _absolute_url(self.context, image_field.url)
         return None
 
     def get_image_thumb(self, obj):
@@ -397,7 +402,7 @@ class ListingImageSerializer(serializers.ModelSerializer):
 
 class ListingSerializer(serializers.ModelSerializer):
     """Serializer for Listing model"""
-    seller = UserSerializer(read_only=True)
+    seller = serializers.SerializerMethodField()
     category_name = serializers.CharField(
         source='category.name',
         read_only=True
@@ -406,16 +411,6 @@ class ListingSerializer(serializers.ModelSerializer):
     municipality_details = MunicipalitySerializer(source='municipality', read_only=True)
     barangay_details = BarangaySerializer(source='barangay', read_only=True)
     images = ListingImageSerializer(many=True, read_only=True)
-    uploaded_images = serializers.ListField(
-        child=ValidatedImageField(),
-        write_only=True,
-        required=False
-    )
-    reused_image_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        write_only=True,
-        required=False
-    )
     is_favorited = serializers.SerializerMethodField()
     location_display = serializers.ReadOnlyField()
 
@@ -430,45 +425,98 @@ class ListingSerializer(serializers.ModelSerializer):
             'condition', 'province', 'province_details', 'municipality', 'municipality_details',
             'barangay', 'barangay_details', 'location_display', 'seller', 'status',
             'views_count', 'featured', 'created_at', 'updated_at',
-            'expires_at', 'images', 'uploaded_images', 'reused_image_ids',
-            'is_favorited'
+            'expires_at', 'images', 'is_favorited'
         ]
         read_only_fields = [
             'id', 'seller', 'views_count', 'created_at',
             'updated_at', 'is_favorited', 'province_details', 'municipality_details', 'barangay_details'
         ]
 
+    # Nested location objects, rendered only when named in ?include=
+    # (comma-separated), e.g. ?include=barangay_details, or passed as
+    # `include=` by callers outside the viewset
+    optional_fields = ('province_details', 'municipality_details', 'barangay_details')
+
+    def __init__(self, *args, include=None, **kwargs):
+        self.include = include
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        """Leave out optional fields that weren't asked for, before they are bound"""
+        fields = super().get_fields()
+        requested = self.include
+        if requested is None:
+            request = self.context.get('request')
+            query_params = getattr(request, 'query_params', {})
+            requested = {name.strip() for name in query_params.get('include', '').split(',')}
+        for field_name in self.optional_fields:
+            if field_name not in requested:
+                fields.pop(field_name, None)
+        return fields
+
+    def get_seller(self, obj):
+        return _user_summary(obj.seller)
+
     def get_is_favorited(self, obj):
         """Check if current user has favorited this listing"""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return Favorite.objects.filter(
-                user=request.user,
-                listing=obj
-            ).exists()
-        return False
+        return _is_favorited(self.context, obj)
+
+
+class ListingWriteSerializer(ListingSerializer):
+    """
+    Serializer for creating and updating listings.
+
+    Adds the write-only image upload fields, so read endpoints using
+    ListingSerializer don't build and copy them for every response.
+    """
+    uploaded_images = serializers.ListField(
+        child=ValidatedImageField(),
+        write_only=True,
+        required=False
+    )
+    reused_image_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        write_only=True,
+        required=False
+    )
+
+    class Meta(ListingSerializer.Meta):
+        fields = ListingSerializer.Meta.fields + ['uploaded_images', 'reused_image_ids']
+
+    def _copy_reused_images(self, listing, image_ids, order):
+        """
+        Attach copies of existing images to a listing, starting at `order`.
+
+        Originals are loaded and the copies inserted with one query each;
+        unknown IDs are skipped. Returns the next free order value.
+        """
+        if not image_ids:
+            return order
+
+        originals = ListingImage.objects.only('id', *ListingImage.SIZE_FIELDS).in_bulk(image_ids)
+        new_images = []
+        for image_id in image_ids:
+            original_image = originals.get(image_id)
+            if original_image is None:
+                continue
+            # Create new ListingImage copying all size variant references
+            new_image = ListingImage(listing=listing, order=order)
+            for field_name in ListingImage.SIZE_FIELDS:
+                original_field = getattr(original_image, field_name, None)
+                if original_field and original_field.name:
+                    setattr(new_image, field_name, original_field.name)
+            new_images.append(new_image)
+            order += 1
+        ListingImage.objects.bulk_create(new_images)
+        return order
 
     def create(self, validated_data):
         uploaded_images = validated_data.pop('uploaded_images', [])
         reused_image_ids = validated_data.pop('reused_image_ids', [])
         listing = Listing.objects.create(**validated_data)
 
-        order = 0
-
         # Add reused images first (copy all size variants)
-        for image_id in reused_image_ids:
-            try:
-                original_image = ListingImage.objects.get(id=image_id)
-                # Create new ListingImage copying all size variant references
-                new_image = ListingImage(listing=listing, order=order)
-                for field_name in ['image_thumb', 'image_small', 'image_medium', 'image_large', 'image_xlarge']:
-                    original_field = getattr(original_image, field_name, None)
-                    if original_field and original_field.name:
-                        setattr(new_image, field_name, original_field.name)
-                new_image.save()
-                order += 1
-            except ListingImage.DoesNotExist:
-                continue
+        order = self._copy_reused_images(listing, reused_image_ids, order=0)
 
         # Then add new uploaded images (process into size variants)
         for image in uploaded_images:
@@ -489,19 +537,9 @@ class ListingSerializer(serializers.ModelSerializer):
         current_max_order = instance.images.count()
 
         # Add reused images (copy all size variants)
-        for image_id in reused_image_ids:
-            try:
-                original_image = ListingImage.objects.get(id=image_id)
-                # Create new ListingImage copying all size variant references
-                new_image = ListingImage(listing=instance, order=current_max_order)
-                for field_name in ['image_thumb', 'image_small', 'image_medium', 'image_large', 'image_xlarge']:
-                    original_field = getattr(original_image, field_name, None)
-                    if original_field and original_field.name:
-                        setattr(new_image, field_name, original_field.name)
-                new_image.save()
-                current_max_order += 1
-            except ListingImage.DoesNotExist:
-                continue
+        current_max_order = self._copy_reused_images(
+            instance, reused_image_ids, order=current_max_order
+        )
 
         # Add new uploaded images (process into size variants)
         for image in uploaded_images:
@@ -511,6 +549,41 @@ class ListingSerializer(serializers.ModelSerializer):
         return instance
 
 
+def first_image_prefetch(lookup='images'):
+    """
+    Prefetch the images ListingListSerializer.get_first_image reads, in order,
+    into `prefetched_images` so list endpoints avoid one query per listing.
+    """
+    return Prefetch(
+        lookup,
+        queryset=ListingImage.objects.only(
+            'id', 'listing', 'order', 'image_medium', 'image_small', 'image_large'
+        ),
+        to_attr='prefetched_images'
+    )
+
+
+def annotate_is_favorited(queryset, user):
+    """
+    Annotate listings with whether `user` has favorited them, as a single
+    EXISTS subquery, for the serializers' `is_favorited` field.
+    """
+    if not user.is_authenticated:
+        return queryset.annotate(is_favorited=Value(False, output_field=BooleanField()))
+    return queryset.annotate(is_favorited=Exists(
+        Favorite.objects.filter(user=user, listing=OuterRef('pk'))
+    ))
+
+
+# Foreign keys ListingListSerializer reads (names, slugs, location_display)
+LISTING_LIST_RELATED = ('seller', 'category', 'province', 'municipality', 'barangay')
+# ListingSerializer also reads the seller's profile and the parents shown by
+# the nested location serializers
+LISTING_DETAIL_RELATED = LISTING_LIST_RELATED + (
+    'seller__profile', 'municipality__province', 'barangay__municipality'
+)
+
+
 class ListingListSerializer(serializers.ModelSerializer):
     """Simplified serializer for listing lists"""
     seller_name = serializers.CharField(
@@ -571,31 +644,34 @@ class ListingListSerializer(serializers.ModelSerializer):
 
     def get_first_image(self, obj):
         """Return medium size image for listing cards (optimal for both mobile and desktop)"""
-        request = self.context.get('request')
-        first_image = obj.images.first()
+        images = getattr(obj, 'prefetched_images', None)
+        if images is None:
+            first_image = obj.images.first()
+        else:
+            first_image = images[0] if images else None
         if first_image:
             # Return medium size for cards, fall back to other sizes if not available
             for field_name in ['image_medium', 'image_small', 'image_large']:
                 image_field = getattr(first_image, field_name, None)
                 if image_field and image_field.name:
-                    if request is not None:
-                        return request.build_absolute_uri(image_field.url)
-                    return image_field.url
+                    return _absolute_url(self.context, image_field.url)
         return None
 
     def get_is_favorited(self, obj):
         """Check if current user has favorited this listing"""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return Favorite.objects.filter(
-                user=request.user,
-                listing=obj
-            ).exists()
-        return False
+        return _is_favorited(self.context, obj)
+
+# Foreign keys AnnouncementListSerializer reads (names and slugs)
+ANNOUNCEMENT_LIST_RELATED = ('author', 'province', 'municipality', 'barangay')
+# AnnouncementSerializer also reads the author's profile and barangay_details
+ANNOUNCEMENT_DETAIL_RELATED = (
+    'author__profile', 'province', 'municipality', 'barangay__municipality'
+)
+
 
 class AnnouncementSerializer(serializers.ModelSerializer):
     """Serializer for Announcement model"""
-    author = UserSerializer(read_only=True)
+    author = serializers.SerializerMethodField()
     province_name = serializers.CharField(
         source='province.name',
         read_only=True
@@ -618,6 +694,9 @@ class AnnouncementSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'author', 'created_at', 'updated_at', 'barangay_details']
 
+    def get_author(self, obj):
+        return _user_summary(obj.author)
+
     def get_is_expired(self, obj):
         """Check if announcement has expired"""
         return obj.is_expired()
@@ -1,12 +1,40 @@
 """
 Django signals for the API app.
 
-Handles automatic cleanup of hero images when they are replaced or cleared.
+Handles automatic cleanup of hero images when they are replaced or cleared,
+and creates a UserProfile for every new user.
 """
-from django.db.models.signals import pre_save
+from django.contrib.auth.models import User
+from django.db.models.signals import post_init, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Province, Municipality
+from .models import Province, Municipality, UserProfile
+
+
+def _hero_image_name(instance):
+    """
+    Stored hero_image path of a loaded instance, read without triggering a
+    query for deferred fields. Returns None when the field isn't loaded.
+    """
+    value = instance.__dict__.get('hero_image')
+    return getattr(value, 'name', value)
+
+
+@receiver(post_init, sender=Province)
+@receiver(post_init, sender=Municipality)
+@receiver(post_save, sender=Province)
+@receiver(post_save, sender=Municipality)
+def remember_hero_image(sender, instance, **kwargs):
+    """
+    Snapshot the stored hero image so saves can detect a change without a query.
+
+    post_init also fires for instances built in memory, where the snapshot is
+    the new value rather than the stored one; the pre_save handler only trusts
+    it once the instance has come from the database.
+    """
+    if kwargs.get('raw'):
+        return
+    instance._original_hero_image = _hero_image_name(instance)
 
 
 @receiver(pre_save, sender=Province)
@@ -18,22 +46,37 @@ def delete_old_hero_image_on_change(sender, instance, **kwargs):
     - The hero image field is cleared (set to blank)
 
     This prevents orphaned image files from accumulating in storage.
+    Fixture loads (raw saves) never delete files.
     """
-    if not instance.pk:
-        # New instance, no old image to delete
+    if kwargs.get('raw') or not instance.pk:
+        # Fixture load, or new instance with no old image to delete
         return
 
-    try:
-        old_instance = sender.objects.get(pk=instance.pk)
-    except sender.DoesNotExist:
-        # Instance doesn't exist yet
-        return
+    old_name = None
+    if not instance._state.adding:
+        old_name = getattr(instance, '_original_hero_image', None)
+    if old_name is None:
+        # Built in memory, or hero_image wasn't loaded with the instance;
+        # fetch just that column
+        old_name = sender.objects.filter(pk=instance.pk).values_list(
+            'hero_image', flat=True
+        ).first()
 
-    old_image = old_instance.hero_image
     new_image = instance.hero_image
 
     # Check if hero_image has changed
-    if old_image and old_image != new_image:
+    if old_name and old_name != new_image.name:
         # Delete the old image file from storage
-        # save=False prevents triggering another save
-        old_image.delete(save=False)
+        new_image.storage.delete(old_name)
+
+
+@receiver(post_save, sender=User)
+def create_user_profile(sender, instance, created, **kwargs):
+    """
+    Create an empty profile alongside every new user, so code handling an
+    existing user can rely on `user.profile` instead of get_or_create().
+
+    Fixture loads (raw saves) bring their own profiles, so they are skipped.
+    """
+    if created and not kwargs.get('raw'):
+        UserProfile.objects.get_or_create(user=instance)
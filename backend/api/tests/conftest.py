@@ -3,8 +3,14 @@ Pytest configuration and shared fixtures
 
 Note: The application uses PSGC (Philippine Standard Geographic Code) for location filtering.
 All province, municipality, and barangay filtering is done via PSGC codes, not slugs or names.
+
+Reference data (provinces, municipalities, barangays, categories) and the test
+users are session-scoped: they are inserted once, outside the per-test
+transactions, and shared by every test. Tests must not modify these rows, and
+must not create other rows with the same PSGC codes, slugs or usernames.
 """
 import pytest
+from allauth.account.models import EmailAddress
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from api.models import Province, Municipality, Barangay, Category
@@ -18,86 +24,196 @@ def api_client():
     return APIClient()
 
 
-@pytest.fixture
-def user(db):
+@pytest.fixture(scope='session')
+def user(django_db_setup, django_db_blocker):
     """Create a test user"""
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+    with django_db_blocker.unblock():
+        user = User.objects.filter(username='testuser').first()
+        if user is None:
+            user = User.objects.create_user(
+                username='testuser',
+                email='test@example.com',
+                password='testpass123'
+            )
+    return user
+
+
+@pytest.fixture(scope='session')
+def verified_user(django_db_setup, django_db_blocker):
+    """Create a verified user (email confirmed)"""
+    with django_db_blocker.unblock():
+        user = User.objects.filter(username='verifieduser').first()
+        if user is None:
+            user = User.objects.create_user(
+                username='verifieduser',
+                email='verified@example.com',
+                password='testpass123',
+                is_active=True
+            )
+            EmailAddress.objects.create(
+                user=user,
+                email=user.email,
+                verified=True,
+                primary=True
+            )
+    return user
 
 
 @pytest.fixture
-def authenticated_client(api_client, user):
+def authenticated_client(db, api_client, user):
     """API client with authenticated user"""
-    api_client.force_authenticate(user=user)
+    # Authenticate as a fresh copy so relations a request caches on it
+    # (e.g. request.user.profile) don't leak into the shared fixture
+    api_client.force_authenticate(user=User.objects.get(pk=user.pk))
     return api_client
 
 
-@pytest.fixture
-def province_davao_del_norte(db):
+@pytest.fixture(scope='session')
+def province_davao_del_norte(django_db_setup, django_db_blocker):
     """Create Davao del Norte province with PSGC code"""
-    return Province.objects.create(
-        name='Davao del Norte',
-        slug='davao-del-norte',
-        psgc_code='112300000',  # Actual PSGC code for Davao del Norte
-        featured=False
-    )
-
-
-@pytest.fixture
-def province_davao_de_oro(db):
+    with django_db_blocker.unblock():
+        province, _ = Province.objects.get_or_create(
+            psgc_code='112300000',  # Actual PSGC code for Davao del Norte
+            defaults={
+                'name': 'Davao del Norte',
+                'slug': 'davao-del-norte',
+                'featured': False,
+            }
+        )
+    return province
+
+
+@pytest.fixture(scope='session')
+def province_davao_de_oro(django_db_setup, django_db_blocker):
     """Create Davao de Oro province with PSGC code"""
-    return Province.objects.create(
-        name='Davao de Oro',
-        slug='davao-de-oro',
-        psgc_code='118200000',  # Actual PSGC code for Davao de Oro
-        featured=False
-    )
-
-
-@pytest.fixture
-def municipality_tagum(db, province_davao_del_norte):
+    with django_db_blocker.unblock():
+        province, _ = Province.objects.get_or_create(
+            psgc_code='118200000',  # Actual PSGC code for Davao de Oro
+            defaults={
+                'name': 'Davao de Oro',
+                'slug': 'davao-de-oro',
+                'featured': False,
+            }
+        )
+    return province
+
+
+@pytest.fixture(scope='session')
+def municipality_tagum(django_db_setup, django_db_blocker, province_davao_del_norte):
     """Create City of Tagum municipality with PSGC code"""
-    return Municipality.objects.create(
-        name='City of Tagum',
-        slug='city-of-tagum',
-        psgc_code='112314000',  # Actual PSGC code for Tagum
-        province=province_davao_del_norte,
-        active=True
-    )
-
-
-@pytest.fixture
-def municipality_montevista(db, province_davao_de_oro):
+    with django_db_blocker.unblock():
+        municipality, _ = Municipality.objects.get_or_create(
+            psgc_code='112314000',  # Actual PSGC code for Tagum
+            defaults={
+                'name': 'City of Tagum',
+                'slug': 'city-of-tagum',
+                'province': province_davao_del_norte,
+                'active': True,
+            }
+        )
+    return municipality
+
+
+@pytest.fixture(scope='session')
+def municipality_montevista(django_db_setup, django_db_blocker, province_davao_de_oro):
     """Create Montevista municipality with PSGC code"""
-    return Municipality.objects.create(
-        name='Montevista',
-        slug='montevista',
-        psgc_code='118205000',  # PSGC code for Montevista
-        province=province_davao_de_oro,
-        active=True
-    )
-
-
-@pytest.fixture
-def barangay_magugpo(db, municipality_tagum):
+    with django_db_blocker.unblock():
+        municipality, _ = Municipality.objects.get_or_create(
+            psgc_code='118205000',  # PSGC code for Montevista
+            defaults={
+                'name': 'Montevista',
+                'slug': 'montevista',
+                'province': province_davao_de_oro,
+                'active': True,
+            }
+        )
+    return municipality
+
+
+@pytest.fixture(scope='session')
+def municipality_asuncion(django_db_setup, django_db_blocker, province_davao_del_norte):
+    """Create Asuncion, a second municipality in Davao del Norte"""
+    with django_db_blocker.unblock():
+        municipality, _ = Municipality.objects.get_or_create(
+            psgc_code='112302000',
+            defaults={
+                'name': 'Asuncion',
+                'slug': 'asuncion',
+                'province': province_davao_del_norte,
+                'active': True,
+            }
+        )
+    return municipality
+
+
+@pytest.fixture(scope='session')
+def barangay_magugpo(django_db_setup, django_db_blocker, municipality_tagum):
     """Create a barangay in City of Tagum"""
-    return Barangay.objects.create(
-        name='Magugpo Poblacion',
-        slug='magugpo-poblacion',
-        psgc_code='112314001',
-        municipality=municipality_tagum,
-        active=True
-    )
+    with django_db_blocker.unblock():
+        barangay, _ = Barangay.objects.get_or_create(
+            psgc_code='112314001',
+            defaults={
+                'name': 'Magugpo Poblacion',
+                'slug': 'magugpo-poblacion',
+                'municipality': municipality_tagum,
+                'active': True,
+            }
+        )
+    return barangay
+
+
+@pytest.fixture(scope='session')
+def barangay_apokon(django_db_setup, django_db_blocker, municipality_tagum):
+    """Create a second barangay in City of Tagum"""
+    with django_db_blocker.unblock():
+        barangay, _ = Barangay.objects.get_or_create(
+            psgc_code='112314002',
+            defaults={
+                'name': 'Apokon',
+                'slug': 'apokon',
+                'municipality': municipality_tagum,
+                'active': True,
+            }
+        )
+    return barangay
+
+
+@pytest.fixture(scope='session')
+def barangay_poblacion_asuncion(django_db_setup, django_db_blocker, municipality_asuncion):
+    """Create a barangay in Asuncion"""
+    with django_db_blocker.unblock():
+        barangay, _ = Barangay.objects.get_or_create(
+            psgc_code='112302001',
+            defaults={
+                'name': 'Poblacion',
+                'slug': 'poblacion-asuncion',
+                'municipality': municipality_asuncion,
+                'active': True,
+            }
+        )
+    return barangay
+
+
+@pytest.fixture(scope='session')
+def category_real_estate(django_db_setup, django_db_blocker):
+    """Create Real Estate category"""
+    with django_db_blocker.unblock():
+        category, _ = Category.objects.get_or_create(
+            slug='real-estate',
+            defaults={
+                'name': 'Real Estate',
+                'icon': '🏠',
+            }
+        )
+    return category
 
 
 @pytest.fixture
-def category_real_estate(db):
-    """Create Real Estate category"""
-    return Category.objects.create(
-        name='Real Estate',
-        slug='real-estate',
-        icon='🏠'
-    )
+def listing_defaults(user, province_davao_del_norte, category_real_estate):
+    """Fields of an active Real Estate listing in Davao del Norte"""
+    return {
+        'province': province_davao_del_norte,
+        'category': category_real_estate,
+        'seller': user,
+        'status': 'active',
+    }
@@ -14,57 +14,70 @@ Key features to test:
 7. Priority-based cascade filtering
 """
 import pytest
-from datetime import date, timedelta
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
 from api.models import Announcement
+from api.views import AnnouncementViewSet
 
 
-@pytest.mark.django_db
-class TestAnnouncementFiltering:
-    """Test announcement filtering by province and municipality using PSGC codes"""
+# Calls the list view directly, skipping URL resolution and middleware, for
+# tests that only exercise the viewset's filtering
+factory = APIRequestFactory()
+announcement_list = AnnouncementViewSet.as_view({'get': 'list'})
 
-    def test_filter_by_province(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
-    ):
-        """Test filtering announcements by province PSGC code"""
-        announcement = Announcement.objects.create(
-            title='Provincial Announcement',
-            description='Important announcement',
-            priority='high',
-            announcement_type='government',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
 
-        # Filter by province PSGC code
-        response = api_client.get('/api/announcements/', {'province': province_davao_del_norte.psgc_code})
+@pytest.fixture
+def build_announcement(user, province_davao_del_norte, municipality_tagum):
+    """
+    Build an unsaved active Announcement in City of Tagum.
 
-        assert response.status_code == 200
-        results = response.data.get('results', response.data)
-        assert len(results) == 1
-        assert results[0]['id'] == announcement.id
+    Keyword arguments override the defaults, so each test only spells out
+    the fields it is about.
+    """
+    defaults = {
+        'priority': 'medium',
+        'announcement_type': 'general',
+        'province': province_davao_del_norte,
+        'municipality': municipality_tagum,
+        'author': user,
+        'is_active': True,
+    }
+
+    def build(**fields):
+        return Announcement(**{**defaults, **fields})
+    return build
+
+
+@pytest.fixture
+def today():
+    """The date AnnouncementViewSet compares expiry dates against"""
+    return timezone.now().date()
+
+
+@pytest.mark.django_db
+class TestAnnouncementFiltering:
+    """Test announcement filtering by province and municipality using PSGC codes"""
 
     def test_filter_by_municipality(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        self, api_client, build_announcement, province_davao_del_norte,
+        municipality_tagum, django_assert_num_queries
     ):
         """Test filtering announcements by municipality PSGC code"""
-        announcement = Announcement.objects.create(
+        announcement = build_announcement(
             title='Municipal Announcement',
             description='City announcement',
-            priority='medium',
-            announcement_type='community',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
+            announcement_type='community'
         )
+        announcement.save()
 
         # Filter by province and municipality PSGC codes
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code,
-            'municipality': municipality_tagum.psgc_code
-        })
+        # Queries: province lookup, municipality lookup, page count, page rows
+        with django_assert_num_queries(4):
+            response = api_client.get('/api/announcements/', {
+                'province': province_davao_del_norte.psgc_code,
+                'municipality': municipality_tagum.psgc_code
+            })
 
         assert response.status_code == 200
         results = response.data.get('results', response.data)
@@ -72,7 +85,9 @@ class TestAnnouncementFiltering:
         assert results[0]['id'] == announcement.id
 
     def test_province_wide_announcements(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        self, build_announcement, province_davao_del_norte, municipality_tagum,
+        municipality_asuncion, barangay_magugpo, barangay_poblacion_asuncion,
+        django_assert_max_num_queries
     ):
         """
         Test that province-wide announcements appear for all municipalities.
@@ -80,67 +95,36 @@ class TestAnnouncementFiltering:
         Province-wide announcements with is_province_wide=True and 'urgent' priority
         should appear when filtering by any municipality in that province.
         """
-        from api.models import Municipality, Barangay
-
-        # Create another municipality and barangays for testing
-        municipality_asuncion = Municipality.objects.create(
-            name='Asuncion',
-            slug='asuncion',
-            psgc_code='112302000',
-            province=province_davao_del_norte,
-            active=True
-        )
-
-        barangay_in_tagum = Barangay.objects.create(
-            name='Magugpo',
-            slug='magugpo',
-            psgc_code='112314001',
-            municipality=municipality_tagum,
-            active=True
-        )
-
-        barangay_in_asuncion = Barangay.objects.create(
-            name='Poblacion',
-            slug='poblacion-asuncion',
-            psgc_code='112302001',
-            municipality=municipality_asuncion,
-            active=True
-        )
-
-        # Create a province-wide urgent announcement
-        province_wide_announcement = Announcement.objects.create(
-            title='Province-wide Announcement',
-            description='Important for entire province',
-            priority='urgent',  # Must be urgent for province-wide cascade
-            announcement_type='alert',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            barangay=barangay_in_tagum,
-            is_province_wide=True,
-            author=user,
-            is_active=True
-        )
-
-        # Create a barangay-specific announcement
-        local_announcement = Announcement.objects.create(
-            title='Tagum Local Announcement',
-            description='Only for Magugpo barangay',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            barangay=barangay_in_tagum,
-            is_province_wide=False,
-            author=user,
-            is_active=True
-        )
+        barangay_in_tagum = barangay_magugpo
+        barangay_in_asuncion = barangay_poblacion_asuncion
+
+        province_wide_announcement, local_announcement = Announcement.objects.bulk_create([
+            # Create a province-wide urgent announcement
+            build_announcement(
+                title='Province-wide Announcement',
+                description='Important for entire province',
+                priority='urgent',  # Must be urgent for province-wide cascade
+                announcement_type='alert',
+                barangay=barangay_in_tagum,
+                is_province_wide=True
+            ),
+            # Create a barangay-specific announcement
+            build_announcement(
+                title='Tagum Local Announcement',
+                description='Only for Magugpo barangay',
+                priority='low',
+                barangay=barangay_in_tagum,
+                is_province_wide=False
+            ),
+        ])
 
         # Filter by Tagum's barangay - should see BOTH announcements
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code,
-            'municipality': municipality_tagum.psgc_code,
-            'barangay': barangay_in_tagum.psgc_code
-        })
+        with django_assert_max_num_queries(5):
+            response = announcement_list(factory.get('/api/announcements/', {
+                'province': province_davao_del_norte.psgc_code,
+                'municipality': municipality_tagum.psgc_code,
+                'barangay': barangay_in_tagum.psgc_code
+            }))
         results = response.data.get('results', response.data)
         assert len(results) == 2
         ids = {r['id'] for r in results}
@@ -148,311 +132,184 @@ class TestAnnouncementFiltering:
         assert local_announcement.id in ids
 
         # Filter by Asuncion's barangay - should see only province-wide urgent announcement
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code,
-            'municipality': municipality_asuncion.psgc_code,
-            'barangay': barangay_in_asuncion.psgc_code
-        })
+        with django_assert_max_num_queries(5):
+            response = announcement_list(factory.get('/api/announcements/', {
+                'province': province_davao_del_norte.psgc_code,
+                'municipality': municipality_asuncion.psgc_code,
+                'barangay': barangay_in_asuncion.psgc_code
+            }))
         results = response.data.get('results', response.data)
         assert len(results) == 1
         assert results[0]['id'] == province_wide_announcement.id
 
-    def test_expired_announcements_excluded_by_default(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
-    ):
-        """Test that expired announcements are excluded by default"""
-        # Create active announcement (future expiry)
-        active_announcement = Announcement.objects.create(
-            title='Active Announcement',
-            description='Still valid',
-            priority='medium',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            expiry_date=date.today() + timedelta(days=7),
-            author=user,
-            is_active=True
-        )
-
-        # Create expired announcement (past expiry)
-        expired_announcement = Announcement.objects.create(
-            title='Expired Announcement',
-            description='No longer valid',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            expiry_date=date.today() - timedelta(days=1),
-            author=user,
-            is_active=True
-        )
-
+    @pytest.mark.parametrize('params, expected_titles', [
         # Default request - should exclude expired
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code
-        })
-        results = response.data.get('results', response.data)
-        assert len(results) == 1
-        assert results[0]['id'] == active_announcement.id
-
-    def test_expired_announcements_included_when_requested(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        ({}, {'Active', 'No Expiry'}),
+        ({'include_expired': 'true'}, {'Active', 'Expired', 'No Expiry'}),
+    ])
+    def test_expired_announcements(
+        self, api_client, build_announcement, province_davao_del_norte, today,
+        django_assert_max_num_queries, params, expected_titles
     ):
-        """Test that expired announcements can be included with include_expired=true"""
-        # Create active announcement
-        active = Announcement.objects.create(
-            title='Active',
-            description='Valid',
-            priority='medium',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            expiry_date=date.today() + timedelta(days=7),
-            author=user,
-            is_active=True
-        )
-
-        # Create expired announcement
-        expired = Announcement.objects.create(
-            title='Expired',
-            description='Invalid',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            expiry_date=date.today() - timedelta(days=1),
-            author=user,
-            is_active=True
-        )
-
-        # Request with include_expired=true
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code,
-            'include_expired': 'true'
-        })
+        """Test that expired announcements are excluded unless include_expired=true"""
+        Announcement.objects.bulk_create([
+            # Create active announcement (future expiry)
+            build_announcement(
+                title='Active',
+                description='Still valid',
+                expiry_date=today + timedelta(days=7)
+            ),
+            # Create expired announcement (past expiry)
+            build_announcement(
+                title='Expired',
+                description='No longer valid',
+                priority='low',
+                expiry_date=today - timedelta(days=1)
+            ),
+            # Announcements without an expiry date never expire
+            build_announcement(
+                title='No Expiry',
+                description='Always valid',
+                priority='high'
+            ),
+        ])
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', {
+                'province': province_davao_del_norte.psgc_code,
+                **params
+            })
         results = response.data.get('results', response.data)
-        assert len(results) == 2
-        ids = {r['id'] for r in results}
-        assert active.id in ids
-        assert expired.id in ids
+        assert {r['title'] for r in results} == expected_titles
 
     def test_inactive_announcements_excluded(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        self, api_client, build_announcement, province_davao_del_norte,
+        django_assert_max_num_queries
     ):
         """Test that inactive announcements are excluded from queryset"""
-        # Create active announcement
-        active = Announcement.objects.create(
-            title='Active',
-            description='Visible',
-            priority='medium',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        # Create inactive announcement
-        inactive = Announcement.objects.create(
-            title='Inactive',
-            description='Hidden',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=False
-        )
+        active, inactive = Announcement.objects.bulk_create([
+            # Create active announcement
+            build_announcement(
+                title='Active',
+                description='Visible'
+            ),
+            # Create inactive announcement
+            build_announcement(
+                title='Inactive',
+                description='Hidden',
+                priority='low',
+                is_active=False
+            ),
+        ])
 
         # Should only see active announcement
-        response = api_client.get('/api/announcements/', {
-            'province': province_davao_del_norte.psgc_code
-        })
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', {
+                'province': province_davao_del_norte.psgc_code
+            })
         results = response.data.get('results', response.data)
         assert len(results) == 1
         assert results[0]['id'] == active.id
 
     def test_filter_multiple_provinces(
-        self, api_client, user, province_davao_del_norte, province_davao_de_oro,
-        municipality_tagum, municipality_montevista
+        self, api_client, build_announcement, province_davao_del_norte,
+        province_davao_de_oro, municipality_montevista,
+        django_assert_max_num_queries
     ):
         """Test that filtering by one province doesn't return announcements from another"""
-        # Create announcements in different provinces
-        norte_announcement = Announcement.objects.create(
-            title='Norte Announcement',
-            description='For Davao del Norte',
-            priority='medium',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        oro_announcement = Announcement.objects.create(
-            title='Oro Announcement',
-            description='For Davao de Oro',
-            priority='medium',
-            announcement_type='general',
-            province=province_davao_de_oro,
-            municipality=municipality_montevista,
-            author=user,
-            is_active=True
-        )
+        norte_announcement, oro_announcement = Announcement.objects.bulk_create([
+            # Create announcements in different provinces
+            build_announcement(
+                title='Norte Announcement',
+                description='For Davao del Norte'
+            ),
+            build_announcement(
+                title='Oro Announcement',
+                description='For Davao de Oro',
+                province=province_davao_de_oro,
+                municipality=municipality_montevista
+            ),
+        ])
 
         # Filter by Davao del Norte
-        response = api_client.get('/api/announcements/', {'province': province_davao_del_norte.psgc_code})
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', {'province': province_davao_del_norte.psgc_code})
         results = response.data.get('results', response.data)
         assert len(results) == 1
         assert results[0]['id'] == norte_announcement.id
 
         # Filter by Davao de Oro
-        response = api_client.get('/api/announcements/', {'province': province_davao_de_oro.psgc_code})
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', {'province': province_davao_de_oro.psgc_code})
         results = response.data.get('results', response.data)
         assert len(results) == 1
         assert results[0]['id'] == oro_announcement.id
 
-    def test_filter_by_priority(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
-    ):
-        """Test filtering announcements by priority"""
-        urgent = Announcement.objects.create(
-            title='Urgent',
-            description='Very important',
-            priority='urgent',
-            announcement_type='alert',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        low = Announcement.objects.create(
-            title='Low Priority',
-            description='Not urgent',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        # Filter by urgent priority
-        response = api_client.get('/api/announcements/', {'priority': 'urgent'})
-        results = response.data.get('results', response.data)
-        assert len(results) == 1
-        assert results[0]['id'] == urgent.id
-
-    def test_filter_by_announcement_type(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
-    ):
-        """Test filtering announcements by type"""
-        alert = Announcement.objects.create(
-            title='Alert',
-            description='Important alert',
-            priority='urgent',
-            announcement_type='alert',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        general = Announcement.objects.create(
-            title='General',
-            description='General info',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        # Filter by alert type
-        response = api_client.get('/api/announcements/', {'announcement_type': 'alert'})
-        results = response.data.get('results', response.data)
-        assert len(results) == 1
-        assert results[0]['id'] == alert.id
-
     def test_search_announcements(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        self, api_client, build_announcement, django_assert_max_num_queries
     ):
         """Test searching announcements by title/description"""
-        Announcement.objects.create(
-            title='Road Closure on Main Street',
-            description='Main street will be closed for repairs',
-            priority='high',
-            announcement_type='infrastructure',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        Announcement.objects.create(
-            title='Community Event',
-            description='Join us for a community gathering',
-            priority='low',
-            announcement_type='community',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
+        Announcement.objects.bulk_create([
+            build_announcement(
+                title='Road Closure on Main Street',
+                description='Main street will be closed for repairs',
+                priority='high',
+                announcement_type='infrastructure'
+            ),
+            build_announcement(
+                title='Community Event',
+                description='Join us for a community gathering',
+                priority='low',
+                announcement_type='community'
+            ),
+        ])
 
         # Search for "road"
-        response = api_client.get('/api/announcements/', {'search': 'road'})
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', {'search': 'road'})
         results = response.data.get('results', response.data)
         assert len(results) == 1
         assert 'Road Closure' in results[0]['title']
 
     def test_ordering_by_priority_and_date(
-        self, api_client, user, province_davao_del_norte, municipality_tagum
+        self, api_client, build_announcement, province_davao_del_norte,
+        django_assert_num_queries
     ):
         """
         Test that announcements are ordered by priority (desc) then created_at (desc)
         """
-        import time
-
         # Create announcements with different priorities
-        low = Announcement.objects.create(
-            title='Low Priority',
-            description='Old low priority',
-            priority='low',
-            announcement_type='general',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-        time.sleep(0.01)  # Ensure different timestamps
-
-        urgent = Announcement.objects.create(
-            title='Urgent',
-            description='New urgent',
-            priority='urgent',
-            announcement_type='alert',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-        time.sleep(0.01)
-
-        high = Announcement.objects.create(
-            title='High Priority',
-            description='New high priority',
-            priority='high',
-            announcement_type='government',
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            author=user,
-            is_active=True
-        )
-
-        response = api_client.get('/api/announcements/', {'province': province_davao_del_norte.psgc_code})
+        low, urgent, high = Announcement.objects.bulk_create([
+            build_announcement(
+                title='Low Priority',
+                description='Old low priority',
+                priority='low'
+            ),
+            build_announcement(
+                title='Urgent',
+                description='New urgent',
+                priority='urgent',
+                announcement_type='alert'
+            ),
+            build_announcement(
+                title='High Priority',
+                description='New high priority',
+                priority='high',
+                announcement_type='government'
+            ),
+        ])
+
+        # Give each a distinct creation time, oldest first. created_at is
+        # auto_now_add, so it can only be overridden after the insert
+        now = timezone.now()
+        for announcement, age in ((low, 30), (urgent, 20), (high, 10)):
+            announcement.created_at = now - timedelta(seconds=age)
+        Announcement.objects.bulk_update([low, urgent, high], ['created_at'])
+
+        # Queries: page count, page rows - independent of the number of
+        # announcements
+        with django_assert_num_queries(2):
+            response = api_client.get('/api/announcements/', {'province': province_davao_del_norte.psgc_code})
         results = response.data.get('results', response.data)
 
         # Priority orders alphabetically DESC: urgent > low > high
@@ -461,3 +318,66 @@ class TestAnnouncementFiltering:
         # The next two could be in any order since they have different alphabetical priorities
         priorities = {results[1]['priority'], results[2]['priority']}
         assert priorities == {'low', 'high'}
+
+
+@pytest.fixture(scope='class')
+def field_filter_announcements(
+    django_db_setup, django_db_blocker, user, province_davao_del_norte,
+    province_davao_de_oro, municipality_tagum, municipality_montevista
+):
+    """
+    One announcement on each side of every filter in TestAnnouncementFieldFilters.
+
+    Inserted once for the whole class, outside the per-test transactions, and
+    removed again afterwards.
+    """
+    with django_db_blocker.unblock():
+        announcements = Announcement.objects.bulk_create([
+            Announcement(
+                title='Urgent Alert',
+                description='Very important',
+                priority='urgent',
+                announcement_type='alert',
+                province=province_davao_del_norte,
+                municipality=municipality_tagum,
+                author=user,
+                is_active=True
+            ),
+            Announcement(
+                title='General Notice',
+                description='Not urgent',
+                priority='low',
+                announcement_type='general',
+                province=province_davao_de_oro,
+                municipality=municipality_montevista,
+                author=user,
+                is_active=True
+            ),
+        ])
+    yield announcements
+    with django_db_blocker.unblock():
+        Announcement.objects.filter(pk__in=[a.pk for a in announcements]).delete()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('field_filter_announcements')
+class TestAnnouncementFieldFilters:
+    """Test that each filter keeps exactly the matching announcement"""
+
+    @pytest.mark.parametrize('params, expected_title', [
+        ({'province': '112300000'}, 'Urgent Alert'),  # Davao del Norte
+        ({'province': '118200000'}, 'General Notice'),  # Davao de Oro
+        ({'priority': 'urgent'}, 'Urgent Alert'),
+        ({'priority': 'low'}, 'General Notice'),
+        ({'announcement_type': 'alert'}, 'Urgent Alert'),
+        ({'announcement_type': 'general'}, 'General Notice'),
+    ])
+    def test_filter_by_field(
+        self, api_client, params, expected_title, django_assert_max_num_queries
+    ):
+        """Test filtering announcements by province PSGC code, priority and type"""
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/api/announcements/', params)
+        assert response.status_code == 200
+        results = response.data.get('results', response.data)
+        assert [r['title'] for r in results] == [expected_title]
@@ -10,61 +10,53 @@ These tests verify:
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework import status
+from api.models import UserProfile
 
 
 User = get_user_model()
 
+# Registration payload that passes validation; tests override single fields
+VALID_REGISTRATION = {
+    'username': 'newuser',
+    'email': 'newuser@example.com',
+    'password': 'securepass123',
+    'password_confirm': 'securepass123',
+    'first_name': 'New',
+    'last_name': 'User',
+}
+
 
 @pytest.mark.django_db
 class TestUserRegistration:
     """Tests for user registration endpoint"""
 
-    def test_register_missing_required_fields(self, api_client):
-        """Test registration fails without required fields"""
-        data = {
-            'username': 'incomplete'
-            # Missing email, password, first_name, last_name
-        }
-        response = api_client.post('/api/auth/registration/', data)
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_register_password_mismatch(self, api_client):
-        """Test registration fails when passwords don't match"""
-        data = {
-            'username': 'newuser',
-            'email': 'newuser@example.com',
-            'password': 'securepass123',
-            'password_confirm': 'differentpass',
-            'first_name': 'New',
-            'last_name': 'User'
-        }
-        response = api_client.post('/api/auth/registration/', data)
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_register_duplicate_username(self, api_client, user):
-        """Test registration fails with duplicate username"""
-        data = {
-            'username': user.username,  # Existing username
-            'email': 'different@example.com',
-            'password': 'securepass123',
-            'password_confirm': 'securepass123',
-            'first_name': 'New',
-            'last_name': 'User'
-        }
-        response = api_client.post('/api/auth/registration/', data)
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_register_invalid_phone_format(self, api_client):
-        """Test registration fails with invalid Philippine phone number"""
-        data = {
-            'username': 'newuser',
-            'email': 'newuser@example.com',
-            'password': 'securepass123',
-            'password_confirm': 'securepass123',
-            'first_name': 'New',
-            'last_name': 'User',
-            'phone_number': '12345'  # Invalid format
-        }
+    @pytest.mark.parametrize('data', [
+        # Missing email, password, first_name, last_name
+        pytest.param({'username': 'incomplete'}, id='missing-required-fields'),
+        pytest.param(
+            {**VALID_REGISTRATION, 'password_confirm': 'differentpass'},
+            id='password-mismatch'
+        ),
+        # Username of the conftest user fixture
+        pytest.param(
+            {**VALID_REGISTRATION, 'username': 'testuser'},
+            id='duplicate-username'
+        ),
+        pytest.param(
+            {**VALID_REGISTRATION, 'phone_number': '12345'},
+            id='invalid-phone-format'
+        ),
+        # Thousands of distinct non-ASCII characters around a valid number
+        pytest.param(
+            {
+                **VALID_REGISTRATION,
+                'phone_number': '09681234567' + ''.join(map(chr, range(0x4E00, 0x4E00 + 5000)))
+            },
+            id='oversized-phone'
+        ),
+    ])
+    def test_register_invalid(self, api_client, user, data):
+        """Test registration fails with missing, mismatched, duplicate or invalid data"""
         response = api_client.post('/api/auth/registration/', data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -73,26 +65,10 @@ class TestUserRegistration:
 class TestUserLogin:
     """Tests for user login endpoint"""
 
-    def test_login_valid_credentials(self, api_client):
+    def test_login_valid_credentials(self, api_client, verified_user):
         """Test successful login with valid credentials"""
-        # Create an active, verified user
-        user = User.objects.create_user(
-            username='logintest',
-            email='login@example.com',
-            password='testpass123',
-            is_active=True
-        )
-        # Create email verification for allauth
-        from allauth.account.models import EmailAddress
-        EmailAddress.objects.create(
-            user=user,
-            email=user.email,
-            verified=True,
-            primary=True
-        )
-
         response = api_client.post('/api/auth/login/', {
-            'username': 'logintest',
+            'username': verified_user.username,
             'password': 'testpass123'
         })
         assert response.status_code == status.HTTP_200_OK
@@ -134,29 +110,11 @@ class TestUserLogin:
 class TestTokenRefresh:
     """Tests for JWT token refresh endpoint"""
 
-    def test_refresh_valid_token(self, api_client):
+    def test_refresh_valid_token(self, api_client, user):
         """Test token refresh with valid refresh token"""
-        # Create verified user and login
-        user = User.objects.create_user(
-            username='refreshtest',
-            email='refresh@example.com',
-            password='testpass123',
-            is_active=True
-        )
-        from allauth.account.models import EmailAddress
-        EmailAddress.objects.create(
-            user=user,
-            email=user.email,
-            verified=True,
-            primary=True
-        )
-
-        # Login to get tokens
-        login_response = api_client.post('/api/auth/login/', {
-            'username': 'refreshtest',
-            'password': 'testpass123'
-        })
-        refresh_token = login_response.data['refresh']
+        # Issue a refresh token directly; logging in is covered by TestUserLogin
+        from rest_framework_simplejwt.tokens import RefreshToken
+        refresh_token = str(RefreshToken.for_user(user))
 
         # Refresh the token
         refresh_response = api_client.post('/api/auth/token/refresh/', {
@@ -220,6 +178,20 @@ class TestUserProfile:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['username'] == user.username
 
+    def test_new_user_has_profile(self, user):
+        """Test that a profile is created together with every user"""
+        assert user.profile.phone_number == ''
+
+    def test_update_phone_number(self, authenticated_client, user):
+        """Test updating the phone number stores it on the user's profile"""
+        response = authenticated_client.patch('/api/auth/profile/', {
+            'phone_number': '+63 968 123 4567'
+        })
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['phone_number'] == '09681234567'
+        profile = UserProfile.objects.get(user=user)
+        assert profile.phone_number == '09681234567'
+
 
 @pytest.mark.django_db
 class TestPublicProfile:
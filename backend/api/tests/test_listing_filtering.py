@@ -20,17 +20,14 @@ class TestListingProvinceFiltering:
     """Test listing filtering by province using PSGC codes"""
 
     def test_filter_by_province(
-        self, api_client, user, province_davao_del_norte, category_real_estate
+        self, api_client, listing_defaults, province_davao_del_norte
     ):
         """Test filtering listings by province PSGC code"""
         listing = Listing.objects.create(
+            **listing_defaults,
             title='Beautiful House in Tagum',
             description='A nice house',
-            price=5000000,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
+            price=5000000
         )
 
         # Filter by province PSGC code
@@ -41,18 +38,15 @@ class TestListingProvinceFiltering:
         assert results[0]['id'] == listing.id
 
     def test_filter_by_province_and_municipality(
-        self, api_client, user, province_davao_del_norte, municipality_tagum, category_real_estate
+        self, api_client, listing_defaults, province_davao_del_norte, municipality_tagum
     ):
         """Test filtering listings by province and municipality PSGC codes"""
         listing = Listing.objects.create(
+            **listing_defaults,
             title='House in City of Tagum',
             description='Near market',
             price=3000000,
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            category=category_real_estate,
-            seller=user,
-            status='active'
+            municipality=municipality_tagum
         )
 
         # Filter by both province and municipality PSGC codes
@@ -67,31 +61,26 @@ class TestListingProvinceFiltering:
         assert results[0]['id'] == listing.id
 
     def test_filter_excludes_other_provinces(
-        self, api_client, user, province_davao_del_norte, province_davao_de_oro,
-        municipality_tagum, municipality_montevista, category_real_estate
+        self, api_client, listing_defaults, province_davao_del_norte, province_davao_de_oro,
+        municipality_tagum, municipality_montevista
     ):
         """Test that filtering by one province doesn't return listings from another"""
-        listing_norte = Listing.objects.create(
-            title='House in Norte',
-            description='Test',
-            price=1000000,
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-
-        listing_oro = Listing.objects.create(
-            title='House in Oro',
-            description='Test',
-            price=2000000,
-            province=province_davao_de_oro,
-            municipality=municipality_montevista,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
+        listing_norte, listing_oro = Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='House in Norte',
+                description='Test',
+                price=1000000,
+                municipality=municipality_tagum
+            ),
+            Listing(
+                **{**listing_defaults, 'province': province_davao_de_oro},
+                title='House in Oro',
+                description='Test',
+                price=2000000,
+                municipality=municipality_montevista
+            ),
+        ])
 
         # Filter by Davao del Norte - should only get Norte listing
         response = api_client.get('/api/listings/', {'province': province_davao_del_norte.psgc_code})
@@ -124,7 +113,8 @@ class TestListingProvinceFiltering:
         assert isinstance(results, list)
 
     def test_province_wide_listing_visibility(
-        self, api_client, user, province_davao_del_norte, municipality_tagum, category_real_estate
+        self, api_client, listing_defaults, province_davao_del_norte, municipality_tagum,
+        municipality_asuncion
     ):
         """
         Test that province-wide listings (no municipality set) appear when filtering by municipality.
@@ -132,40 +122,24 @@ class TestListingProvinceFiltering:
         A listing with only province set (no municipality) should appear when users
         filter by any municipality within that province.
         """
-        from api.models import Municipality
-
-        # Create another municipality in the same province
-        municipality_asuncion = Municipality.objects.create(
-            name='Asuncion',
-            slug='asuncion',
-            psgc_code='112302000',
-            province=province_davao_del_norte,
-            active=True
-        )
-
-        # Create a province-wide listing (no specific municipality)
-        province_wide_listing = Listing.objects.create(
-            title='Province-wide Service',
-            description='Available throughout Davao del Norte',
-            price=10000,
-            province=province_davao_del_norte,
-            municipality=None,  # No specific municipality
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-
-        # Create a municipality-specific listing
-        tagum_listing = Listing.objects.create(
-            title='Tagum Property',
-            description='Only in Tagum',
-            price=5000000,
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
+        province_wide_listing, tagum_listing = Listing.objects.bulk_create([
+            # Create a province-wide listing (no specific municipality)
+            Listing(
+                **listing_defaults,
+                title='Province-wide Service',
+                description='Available throughout Davao del Norte',
+                price=10000,
+                municipality=None  # No specific municipality
+            ),
+            # Create a municipality-specific listing
+            Listing(
+                **listing_defaults,
+                title='Tagum Property',
+                description='Only in Tagum',
+                price=5000000,
+                municipality=municipality_tagum
+            ),
+        ])
 
         # Filter by Tagum municipality - should see BOTH
         response = api_client.get('/api/listings/', {
@@ -188,45 +162,29 @@ class TestListingProvinceFiltering:
         assert results[0]['id'] == province_wide_listing.id
 
     def test_filter_with_barangay(
-        self, api_client, user, province_davao_del_norte, municipality_tagum,
-        barangay_magugpo, category_real_estate
+        self, api_client, listing_defaults, province_davao_del_norte, municipality_tagum,
+        barangay_magugpo, barangay_apokon
     ):
         """Test filtering by province, municipality, and barangay PSGC codes"""
-        from api.models import Barangay
-
-        # Create another barangay
-        barangay_apokon = Barangay.objects.create(
-            name='Apokon',
-            slug='apokon',
-            psgc_code='112314002',
-            municipality=municipality_tagum,
-            active=True
-        )
-
         # Create listings at different levels
-        barangay_listing = Listing.objects.create(
-            title='Barangay Property',
-            description='In Magugpo Poblacion',
-            price=1000000,
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            barangay=barangay_magugpo,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-
-        municipality_wide_listing = Listing.objects.create(
-            title='Municipality-wide Service',
-            description='Throughout City of Tagum',
-            price=5000,
-            province=province_davao_del_norte,
-            municipality=municipality_tagum,
-            barangay=None,  # Municipality-wide
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
+        barangay_listing, municipality_wide_listing = Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='Barangay Property',
+                description='In Magugpo Poblacion',
+                price=1000000,
+                municipality=municipality_tagum,
+                barangay=barangay_magugpo
+            ),
+            Listing(
+                **listing_defaults,
+                title='Municipality-wide Service',
+                description='Throughout City of Tagum',
+                price=5000,
+                municipality=municipality_tagum,
+                barangay=None  # Municipality-wide
+            ),
+        ])
 
         # Filter by Magugpo barangay - should see barangay listing + municipality-wide
         response = api_client.get('/api/listings/', {
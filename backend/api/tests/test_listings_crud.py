@@ -9,36 +9,18 @@ These tests verify:
 5. Favorites functionality
 """
 import pytest
+from django.contrib.auth import get_user_model
 from rest_framework import status
-from api.models import Listing, Favorite
+from api.models import Category, Listing, Favorite
 
-
-@pytest.fixture
-def verified_user(db):
-    """Create a verified user (email confirmed)"""
-    from django.contrib.auth import get_user_model
-    from allauth.account.models import EmailAddress
-
-    User = get_user_model()
-    user = User.objects.create_user(
-        username='verifieduser',
-        email='verified@example.com',
-        password='testpass123',
-        is_active=True
-    )
-    EmailAddress.objects.create(
-        user=user,
-        email=user.email,
-        verified=True,
-        primary=True
-    )
-    return user
+User = get_user_model()
 
 
 @pytest.fixture
-def verified_client(api_client, verified_user):
+def verified_client(db, api_client, verified_user):
     """API client authenticated as a verified user"""
-    api_client.force_authenticate(user=verified_user)
+    # Fresh copy, so the shared session fixture never caches request state
+    api_client.force_authenticate(user=User.objects.get(pk=verified_user.pk))
     return api_client
 
 
@@ -111,7 +93,8 @@ class TestListingRead:
     """Tests for reading listings"""
 
     def test_list_listings_public(
-        self, api_client, user, province_davao_del_norte, category_real_estate
+        self, api_client, user, province_davao_del_norte, category_real_estate,
+        django_assert_num_queries
     ):
         """Test anyone can list active listings"""
         Listing.objects.create(
@@ -124,7 +107,10 @@ class TestListingRead:
             status='active'
         )
 
-        response = api_client.get('/api/listings/')
+        # Queries: page count, page rows with seller, category and location
+        # joined in, first images
+        with django_assert_num_queries(3):
+            response = api_client.get('/api/listings/')
         assert response.status_code == status.HTTP_200_OK
         results = response.data.get('results', response.data)
         assert len(results) == 1
@@ -149,33 +135,54 @@ class TestListingRead:
         assert response.data['title'] == 'Detailed Listing'
         assert response.data['description'] == 'Full details'
 
-    def test_get_nonexistent_listing(self, api_client):
-        """Test getting nonexistent listing returns 404"""
-        response = api_client.get('/api/listings/99999/')
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
-    def test_inactive_listings_not_in_list(
+    def test_listing_detail_location_details_opt_in(
         self, api_client, user, province_davao_del_norte, category_real_estate
     ):
-        """Test inactive/sold listings don't appear in public list"""
-        Listing.objects.create(
-            title='Active Listing',
-            description='Visible',
-            price=1000,
+        """Test nested location details are only rendered when requested"""
+        listing = Listing.objects.create(
+            title='Detailed Listing',
+            description='Full details',
+            price=2000,
             province=province_davao_del_norte,
             category=category_real_estate,
             seller=user,
             status='active'
         )
-        Listing.objects.create(
-            title='Sold Listing',
-            description='Not visible',
-            price=2000,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='sold'
+
+        response = api_client.get(f'/api/listings/{listing.id}/')
+        assert 'province_details' not in response.data
+        assert 'barangay_details' not in response.data
+
+        response = api_client.get(
+            f'/api/listings/{listing.id}/', {'include': 'province_details'}
         )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['province_details']['slug'] == province_davao_del_norte.slug
+        assert 'municipality_details' not in response.data
+
+    def test_get_nonexistent_listing(self, api_client):
+        """Test getting nonexistent listing returns 404"""
+        response = api_client.get('/api/listings/99999/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_inactive_listings_not_in_list(
+        self, api_client, listing_defaults
+    ):
+        """Test inactive/sold listings don't appear in public list"""
+        Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='Active Listing',
+                description='Visible',
+                price=1000
+            ),
+            Listing(
+                **{**listing_defaults, 'status': 'sold'},
+                title='Sold Listing',
+                description='Not visible',
+                price=2000
+            ),
+        ])
 
         response = api_client.get('/api/listings/')
         results = response.data.get('results', response.data)
@@ -213,9 +220,6 @@ class TestListingUpdate:
         self, verified_client, province_davao_del_norte, category_real_estate
     ):
         """Test user cannot update another user's listing"""
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-
         other_user = User.objects.create_user(
             username='otheruser',
             email='other@example.com',
@@ -282,9 +286,6 @@ class TestListingDelete:
         self, verified_client, province_davao_del_norte, category_real_estate
     ):
         """Test user cannot delete another user's listing"""
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-
         other_user = User.objects.create_user(
             username='otheruser2',
             email='other2@example.com',
@@ -349,7 +350,8 @@ class TestFavorites:
         assert not Favorite.objects.filter(user=user, listing=listing).exists()
 
     def test_list_favorites(
-        self, authenticated_client, user, province_davao_del_norte, category_real_estate
+        self, authenticated_client, user, province_davao_del_norte, category_real_estate,
+        django_assert_max_num_queries
     ):
         """Test user can list their favorites"""
         listing = Listing.objects.create(
@@ -363,7 +365,10 @@ class TestFavorites:
         )
         Favorite.objects.create(user=user, listing=listing)
 
-        response = authenticated_client.get('/api/listings/favorites/')
+        # Queries: favorited listings with their foreign keys joined in,
+        # first images - independent of the number of favorites
+        with django_assert_max_num_queries(3):
+            response = authenticated_client.get('/api/listings/favorites/')
         assert response.status_code == status.HTTP_200_OK
         # Could be a list or have results depending on pagination
         results = response.data if isinstance(response.data, list) else response.data.get('results', response.data)
@@ -380,27 +385,23 @@ class TestListingSearch:
     """Tests for listing search functionality"""
 
     def test_search_by_title(
-        self, api_client, user, province_davao_del_norte, category_real_estate
+        self, api_client, listing_defaults
     ):
         """Test searching listings by title"""
-        Listing.objects.create(
-            title='Beautiful House',
-            description='Nice property',
-            price=1000,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-        Listing.objects.create(
-            title='Car for Sale',
-            description='Great vehicle',
-            price=500,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
+        Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='Beautiful House',
+                description='Nice property',
+                price=1000
+            ),
+            Listing(
+                **listing_defaults,
+                title='Car for Sale',
+                description='Great vehicle',
+                price=500
+            ),
+        ])
 
         response = api_client.get('/api/listings/', {'search': 'house'})
         results = response.data.get('results', response.data)
@@ -408,27 +409,23 @@ class TestListingSearch:
         assert 'House' in results[0]['title']
 
     def test_filter_by_price_range(
-        self, api_client, user, province_davao_del_norte, category_real_estate
+        self, api_client, listing_defaults
     ):
         """Test filtering listings by price range"""
-        Listing.objects.create(
-            title='Cheap Item',
-            description='Affordable',
-            price=100,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-        Listing.objects.create(
-            title='Expensive Item',
-            description='Premium',
-            price=10000,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
+        Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='Cheap Item',
+                description='Affordable',
+                price=100
+            ),
+            Listing(
+                **listing_defaults,
+                title='Expensive Item',
+                description='Premium',
+                price=10000
+            ),
+        ])
 
         response = api_client.get('/api/listings/', {'min_price': 1000})
         results = response.data.get('results', response.data)
@@ -436,35 +433,29 @@ class TestListingSearch:
         assert results[0]['title'] == 'Expensive Item'
 
     def test_filter_by_category(
-        self, api_client, user, province_davao_del_norte, category_real_estate
+        self, api_client, listing_defaults, category_real_estate
     ):
         """Test filtering listings by category"""
-        from api.models import Category
-
         vehicles_category = Category.objects.create(
             name='Vehicles',
             slug='vehicles',
             icon='🚗'
         )
 
-        Listing.objects.create(
-            title='House',
-            description='Property',
-            price=1000,
-            province=province_davao_del_norte,
-            category=category_real_estate,
-            seller=user,
-            status='active'
-        )
-        Listing.objects.create(
-            title='Car',
-            description='Vehicle',
-            price=500,
-            province=province_davao_del_norte,
-            category=vehicles_category,
-            seller=user,
-            status='active'
-        )
+        Listing.objects.bulk_create([
+            Listing(
+                **listing_defaults,
+                title='House',
+                description='Property',
+                price=1000
+            ),
+            Listing(
+                **{**listing_defaults, 'category': vehicles_category},
+                title='Car',
+                description='Vehicle',
+                price=500
+            ),
+        ])
 
         response = api_client.get('/api/listings/', {'category': category_real_estate.id})
         results = response.data.get('results', response.data)
@@ -0,0 +1,54 @@
+"""
+Tests for the orjson-based default renderer.
+
+These tests verify:
+1. Output matches DRF's JSONRenderer for the types serializers produce
+2. Types orjson can't encode natively fall back to DRF's JSONEncoder
+3. Where it deliberately differs from DRF (non-finite floats)
+"""
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Tests for ORJSONRenderer"""
+
+    def test_renders_compact_json(self):
+        """Test plain data renders like DRF's JSONRenderer"""
+        data = {'id': 1, 'title': 'Lote sa Tagum', 'images': [], 'is_favorited': False}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_none_as_empty_body(self):
+        """Test None renders as an empty body (e.g. 204 responses)"""
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_datetime_matches_drf_format(self):
+        """Test datetimes keep DRF's ISO 8601 format"""
+        data = {'created_at': datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc)}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_fallback_types(self):
+        """Test lazy strings and Decimals are encoded via DRF's JSONEncoder"""
+        data = {'message': _('Not found.'), 'price': Decimal('1500.50')}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_escapes_line_and_paragraph_separators(self):
+        """Test U+2028/U+2029 are escaped like DRF's JSONRenderer does"""
+        data = {'description': 'Unang linya\u2028Ikalawa\u2029Ikatlo'}
+        rendered = ORJSONRenderer().render(data)
+        assert rendered == JSONRenderer().render(data)
+        assert json.loads(rendered) == data
+
+    @pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf')])
+    def test_non_finite_floats_render_as_null(self, value):
+        """Test NaN/Infinity render as null, where DRF's STRICT_JSON raises"""
+        assert ORJSONRenderer().render({'value': value}) == b'{"value":null}'
+        with pytest.raises(ValueError):
+            JSONRenderer().render({'value': value})
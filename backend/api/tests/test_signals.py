@@ -0,0 +1,107 @@
+"""
+Tests for the API app's signal handlers.
+
+These tests verify:
+1. Replaced hero images are deleted, including on instances built in memory
+2. Fixture loads (raw saves) never delete hero images
+3. New users get a profile, without clashing with profiles loaded from fixtures
+"""
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from api.models import Province, UserProfile
+
+
+User = get_user_model()
+
+
+@pytest.fixture
+def stored_hero(settings, tmp_path):
+    """Save a hero image file to storage and return its name"""
+    settings.MEDIA_ROOT = tmp_path
+    return default_storage.save('provinces/heroes/old.jpg', ContentFile(b'old'))
+
+
+@pytest.fixture
+def province_with_hero(stored_hero):
+    """A province whose hero_image points at the stored file"""
+    return Province.objects.create(name='Signal Province', hero_image=stored_hero)
+
+
+@pytest.mark.django_db
+class TestHeroImageCleanup:
+    """Tests for delete_old_hero_image_on_change"""
+
+    def test_replacing_loaded_instance_deletes_old_file(self, province_with_hero, stored_hero):
+        """Test replacing the hero image of a loaded province deletes the old file"""
+        province = Province.objects.get(pk=province_with_hero.pk)
+        province.hero_image = 'provinces/heroes/new.jpg'
+        province.save()
+        assert not default_storage.exists(stored_hero)
+
+    def test_replacing_in_memory_instance_deletes_old_file(self, province_with_hero, stored_hero):
+        """Test an instance built with an existing pk compares against the stored image"""
+        Province(
+            pk=province_with_hero.pk,
+            name=province_with_hero.name,
+            slug=province_with_hero.slug,
+            hero_image='provinces/heroes/new.jpg'
+        ).save()
+        assert not default_storage.exists(stored_hero)
+
+    def test_raw_save_keeps_old_file(self, province_with_hero, stored_hero):
+        """Test loading a fixture over an existing province leaves its files alone"""
+        fixture = json.dumps([{
+            'model': 'api.province',
+            'pk': province_with_hero.pk,
+            'fields': {
+                'name': province_with_hero.name,
+                'slug': province_with_hero.slug,
+                'hero_image': 'provinces/heroes/new.jpg',
+                # Raw saves write the values as given, auto_now fields included
+                'created_at': '2025-01-01T00:00:00Z',
+                'updated_at': '2025-01-01T00:00:00Z',
+            },
+        }])
+        for obj in serializers.deserialize('json', fixture):
+            obj.save()
+        assert default_storage.exists(stored_hero)
+
+
+@pytest.mark.django_db
+class TestCreateUserProfile:
+    """Tests for create_user_profile"""
+
+    def test_new_user_gets_profile(self):
+        """Test creating a user creates an empty profile"""
+        user = User.objects.create_user(username='profileduser', password='testpass123')
+        assert UserProfile.objects.filter(user=user).exists()
+
+    def test_loaddata_with_profile(self, tmp_path):
+        """Test loading a user fixture together with its profile"""
+        fixture = tmp_path / 'users.json'
+        fixture.write_text(json.dumps([
+            {
+                'model': 'auth.user',
+                'pk': 9001,
+                'fields': {
+                    'username': 'fixtureuser',
+                    'password': '!',
+                    'email': 'fixture@example.com',
+                    'date_joined': '2025-01-01T00:00:00Z',
+                },
+            },
+            {
+                'model': 'api.userprofile',
+                'pk': 9001,
+                'fields': {'user': 9001, 'location': 'Tagum'},
+            },
+        ]))
+        call_command('loaddata', str(fixture), verbosity=0)
+        assert UserProfile.objects.get(user_id=9001).location == 'Tagum'
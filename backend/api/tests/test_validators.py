@@ -6,6 +6,7 @@ These tests verify:
 2. Image type/content-type validation
 3. Image extension validation
 4. ValidatedImageField serializer field
+5. PhilippinePhoneField normalization
 """
 import pytest
 from io import BytesIO
@@ -16,6 +17,7 @@ from rest_framework import serializers
 
 from api.validators import (
     validate_image_file,
+    PhilippinePhoneField,
     ValidatedImageField,
     MAX_IMAGE_SIZE,
     ALLOWED_IMAGE_TYPES
@@ -221,3 +223,53 @@ class TestValidatedImageField:
 
         serializer = TestSerializer(data={'images': [valid_image, invalid_image]})
         assert not serializer.is_valid()
+
+
+class TestPhilippinePhoneField:
+    """Tests for PhilippinePhoneField serializer field"""
+
+    class PhoneSerializer(serializers.Serializer):
+        phone_number = PhilippinePhoneField(required=False, allow_blank=True)
+
+    def test_local_format_passes(self):
+        """Test that an 11-digit local number is kept as-is"""
+        serializer = self.PhoneSerializer(data={'phone_number': '09681234567'})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data['phone_number'] == '09681234567'
+
+    def test_separators_are_stripped(self):
+        """Test that spaces and dashes are removed"""
+        serializer = self.PhoneSerializer(data={'phone_number': '0968-123 4567'})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data['phone_number'] == '09681234567'
+
+    def test_international_format_converted(self):
+        """Test that +63 numbers are converted to local format"""
+        serializer = self.PhoneSerializer(data={'phone_number': '+63 968 123 4567'})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data['phone_number'] == '09681234567'
+
+    def test_blank_allowed(self):
+        """Test that a blank phone number passes through"""
+        serializer = self.PhoneSerializer(data={'phone_number': ''})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data['phone_number'] == ''
+
+    def test_wrong_length_fails(self):
+        """Test that numbers that are not 11 digits are rejected"""
+        serializer = self.PhoneSerializer(data={'phone_number': '0968123'})
+        assert not serializer.is_valid()
+        assert 'phone_number' in serializer.errors
+
+    def test_missing_leading_zero_fails(self):
+        """Test that 11-digit numbers not starting with 0 are rejected"""
+        serializer = self.PhoneSerializer(data={'phone_number': '19681234567'})
+        assert not serializer.is_valid()
+        assert 'phone_number' in serializer.errors
+
+    def test_oversized_input_rejected_before_cleaning(self):
+        """Test that raw input over max_length is rejected before separators are stripped"""
+        phone_number = '0968' + ''.join(map(chr, range(0x4E00, 0x4E00 + 5000)))
+        serializer = self.PhoneSerializer(data={'phone_number': phone_number})
+        assert not serializer.is_valid()
+        assert serializer.errors['phone_number'][0].code == 'max_length'
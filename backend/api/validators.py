@@ -1,6 +1,8 @@
 """
 Custom validators for the API.
 """
+import re
+
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
@@ -12,6 +14,10 @@ ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/gif', 'image/webp']
 ALLOWED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
 
 
+# Everything that isn't a digit: spaces, dashes, dots, parentheses, '+'
+_NON_DIGIT = re.compile(r'\D')
+
+
 def validate_image_file(image):
     """
     Validate an uploaded image file for size and type.
@@ -96,3 +102,44 @@ class ValidatedImageField(serializers.ImageField):
             )
 
         return file
+
+
+class PhilippinePhoneField(serializers.CharField):
+    """
+    CharField that normalizes Philippine phone numbers.
+
+    Separators are stripped and the 63 country prefix becomes a leading 0,
+    so the value is always 11 digits starting with 0 (or blank).
+
+    Usage in serializers:
+        phone_number = PhilippinePhoneField(required=False, allow_blank=True)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('max_length', 20)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if not value:
+            return value
+
+        # max_length is otherwise only checked on the cleaned value, after the
+        # raw input has already been scanned
+        if self.max_length is not None and len(value) > self.max_length:
+            self.fail('max_length', max_length=self.max_length)
+
+        # Remove spaces, dashes, and other common separators
+        cleaned = _NON_DIGIT.sub('', value)
+
+        # Convert international format (63) to local format (0)
+        if cleaned.startswith('63') and len(cleaned) == 12:
+            cleaned = '0' + cleaned[2:]
+
+        # Validate format: must be 11 digits starting with 0
+        if cleaned and (len(cleaned) != 11 or not cleaned.startswith('0')):
+            raise serializers.ValidationError(
+                'Phone number must be 11 digits starting with 0 (e.g., 09681234567)'
+            )
+
+        return cleaned
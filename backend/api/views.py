@@ -7,6 +7,8 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.contrib.auth.models import User
+from django.db.models import Count, Prefetch, Q
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .throttles import AuthRateThrottle, PasswordResetRateThrottle
@@ -22,8 +24,11 @@ from .serializers import (
     BarangaySerializer,
     UserSerializer, PublicUserSerializer, UserRegistrationSerializer,
     UserProfileUpdateSerializer, ProfilePictureSerializer,
-    CategorySerializer, ListingSerializer, ListingListSerializer,
-    AnnouncementSerializer, AnnouncementListSerializer
+    CategorySerializer, ListingSerializer, ListingListSerializer, ListingWriteSerializer,
+    LISTING_LIST_RELATED, LISTING_DETAIL_RELATED, annotate_is_favorited,
+    first_image_prefetch,
+    AnnouncementSerializer, AnnouncementListSerializer,
+    ANNOUNCEMENT_LIST_RELATED, ANNOUNCEMENT_DETAIL_RELATED
 )
 from .permissions import IsEmailVerified, IsOwnerOrReadOnly
 
@@ -108,13 +113,8 @@ def upload_profile_picture(request):
 
     image_file = serializer.validated_data['image']
 
-    try:
-        # Get or create user profile
-        profile = request.user.profile
-    except AttributeError:
-        # Profile doesn't exist yet, create one
-        from .models import UserProfile
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    # Every user has a profile (created by the post_save signal)
+    profile = request.user.profile
 
     # Process and save the profile picture
     profile.set_profile_picture(image_file)
@@ -156,7 +156,14 @@ def delete_profile_picture(request):
 def public_user_profile_view(request, username):
     """API endpoint to get public user profile by username"""
     try:
-        user = User.objects.get(username=username)
+        user = User.objects.select_related('profile').annotate(
+            listing_count=Count(
+                'listings', filter=Q(listings__status='active'), distinct=True
+            ),
+            announcement_count=Count(
+                'announcements', filter=Q(announcements__is_active=True), distinct=True
+            ),
+        ).get(username=username)
         serializer = PublicUserSerializer(user, context={'request': request})
         return Response(serializer.data)
     except User.DoesNotExist:
@@ -172,9 +179,12 @@ def public_user_listings_view(request, username):
     """API endpoint to get listings by a specific user"""
     try:
         user = User.objects.get(username=username)
-        queryset = Listing.objects.filter(seller=user, status='active').order_by('-created_at')
+        queryset = annotate_is_favorited(Listing.objects.filter(
+            seller=user, status='active'
+        ), request.user).select_related(*LISTING_LIST_RELATED).prefetch_related(
+            first_image_prefetch()
+        ).order_by('-created_at')
 
-        from .serializers import ListingListSerializer
         serializer = ListingListSerializer(queryset, many=True, context={'request': request})
         return Response(serializer.data)
     except User.DoesNotExist:
@@ -190,9 +200,10 @@ def public_user_announcements_view(request, username):
     """API endpoint to get announcements by a specific user"""
     try:
         user = User.objects.get(username=username)
-        queryset = Announcement.objects.filter(author=user, is_active=True).order_by('-created_at')
+        queryset = Announcement.objects.filter(
+            author=user, is_active=True
+        ).select_related(*ANNOUNCEMENT_LIST_RELATED).order_by('-created_at')
 
-        from .serializers import AnnouncementListSerializer
         serializer = AnnouncementListSerializer(queryset, many=True, context={'request': request})
         return Response(serializer.data)
     except User.DoesNotExist:
@@ -204,11 +215,24 @@ def public_user_announcements_view(request, username):
 
 class ProvinceViewSet(viewsets.ReadOnlyModelViewSet):
     """API endpoint for viewing provinces"""
-    queryset = Province.objects.filter(active=True).prefetch_related('municipalities')
+    queryset = Province.objects.filter(active=True)
     permission_classes = [AllowAny]
     lookup_field = 'slug'
     pagination_class = None  # Disable pagination - need all provinces for dropdown
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return queryset.annotate(
+                municipality_count=Count('municipalities', filter=Q(municipalities__active=True))
+            )
+        # Detail views list the active municipalities; the count reuses the same rows
+        return queryset.prefetch_related(Prefetch(
+            'municipalities',
+            queryset=Municipality.objects.filter(active=True),
+            to_attr='active_municipalities'
+        ))
+
     def get_serializer_class(self):
         if self.action == 'list':
             return ProvinceListSerializer
@@ -385,7 +409,18 @@ def location_search(request):
 
 class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """API endpoint for viewing categories"""
-    queryset = Category.objects.filter(active=True, parent=None)
+    queryset = Category.objects.filter(active=True, parent=None).prefetch_related(
+        Prefetch(
+            'subcategories',
+            queryset=Category.objects.filter(active=True),
+            to_attr='active_subcategories'
+        ),
+        Prefetch(
+            'active_subcategories__subcategories',
+            queryset=Category.objects.filter(active=True),
+            to_attr='active_subcategories'
+        ),
+    )
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
@@ -415,11 +450,29 @@ class ListingViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action in ['list', 'my_listings', 'favorites']:
             return ListingListSerializer
+        if self.action in ['create', 'update', 'partial_update']:
+            return ListingWriteSerializer
         return ListingSerializer
 
     def get_queryset(self):
-        from django.db.models import Q
-        queryset = super().get_queryset()
+        queryset = annotate_is_favorited(super().get_queryset(), self.request.user)
+
+        if self.action == 'list':
+            queryset = queryset.select_related(*LISTING_LIST_RELATED).prefetch_related(
+                first_image_prefetch()
+            )
+        else:
+            queryset = queryset.select_related(*LISTING_DETAIL_RELATED)
+        if self.action == 'retrieve':
+            # Hydrate the detail page's images in one query with only the columns
+            # ListingImageSerializer reads. Not used for update actions, which add
+            # images after the instance is loaded and would see a stale cache.
+            queryset = queryset.prefetch_related(Prefetch(
+                'images',
+                queryset=ListingImage.objects.only(
+                    'id', 'listing', 'order', *ListingImage.SIZE_FIELDS
+                ).order_by('order', 'uploaded_at')
+            ))
 
         # Filter by price range
         min_price = self.request.query_params.get('min_price')
@@ -438,7 +491,6 @@ class ListingViewSet(viewsets.ModelViewSet):
         if province_code and municipality_code and barangay_code:
             # Barangay level: Show listings in this barangay, or municipality-wide, or province-wide
             try:
-                from api.models import Province, Municipality, Barangay
                 province_obj = Province.objects.get(psgc_code=province_code)
                 municipality_obj = Municipality.objects.get(psgc_code=municipality_code, province=province_obj)
                 barangay_obj = Barangay.objects.get(psgc_code=barangay_code, municipality=municipality_obj)
@@ -455,7 +507,6 @@ class ListingViewSet(viewsets.ModelViewSet):
         elif province_code and municipality_code:
             # Municipality level: Show listings in this municipality (any barangay) or province-wide
             try:
-                from api.models import Province, Municipality
                 province_obj = Province.objects.get(psgc_code=province_code)
                 municipality_obj = Municipality.objects.get(psgc_code=municipality_code, province=province_obj)
 
@@ -467,13 +518,9 @@ class ListingViewSet(viewsets.ModelViewSet):
                 queryset = queryset.none()
 
         elif province_code:
-            # Province level: Show all listings in this province
-            try:
-                from api.models import Province
-                province_obj = Province.objects.get(psgc_code=province_code)
-                queryset = queryset.filter(province=province_obj)
-            except Province.DoesNotExist:
-                queryset = queryset.none()
+            # Province level: Show all listings in this province. PSGC codes
+            # are unique, so joining on the code skips a separate lookup
+            queryset = queryset.filter(province__psgc_code=province_code)
 
         return queryset
 
@@ -491,7 +538,11 @@ class ListingViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def my_listings(self, request):
         """Get listings created by the current user"""
-        queryset = Listing.objects.filter(seller=request.user).order_by('-created_at')
+        queryset = annotate_is_favorited(Listing.objects.filter(
+            seller=request.user
+        ), request.user).select_related(*LISTING_LIST_RELATED).prefetch_related(
+            first_image_prefetch()
+        ).order_by('-created_at')
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -561,10 +612,11 @@ class ListingViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def favorites(self, request):
         """Get all favorited listings for the current user"""
-        favorites = Favorite.objects.filter(
-            user=request.user
-        ).select_related('listing')
-        listings = [fav.listing for fav in favorites]
+        listings = annotate_is_favorited(Listing.objects.filter(
+            favorited_by__user=request.user
+        ), request.user).select_related(*LISTING_LIST_RELATED).prefetch_related(
+            first_image_prefetch()
+        ).order_by('-favorited_by__created_at')
         serializer = self.get_serializer(listings, many=True)
         return Response(serializer.data)
 
@@ -614,14 +666,20 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.select_related(*ANNOUNCEMENT_LIST_RELATED)
+        else:
+            queryset = queryset.select_related(*ANNOUNCEMENT_DETAIL_RELATED)
 
         # Option to show expired announcements
         include_expired = self.request.query_params.get('include_expired', 'false')
         if include_expired.lower() != 'true':
-            from django.utils import timezone
-            # Filter out expired announcements
-            queryset = queryset.exclude(
-                expiry_date__lt=timezone.now().date()
+            # Filter out expired announcements. Spelled as a plain range
+            # rather than exclude(expiry_date__lt=...), which compiles to
+            # NOT (... AND expiry_date IS NOT NULL) and can't use an index
+            queryset = queryset.filter(
+                Q(expiry_date__isnull=True) |
+                Q(expiry_date__gte=timezone.now().date())
             )
 
         # Handle province, municipality, and barangay filtering using PSGC codes
@@ -630,8 +688,6 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         barangay_code = self.request.query_params.get('barangay')
 
         if barangay_code and municipality_code and province_code:
-            from django.db.models import Q
-            from api.models import Province, Municipality, Barangay
             # Priority-based cascade filtering for barangay level:
             # 1. Direct barangay match (by PSGC code)
             # 2. Municipality-wide with High/Urgent priority
@@ -651,8 +707,6 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
                 # If location not found, return empty queryset
                 queryset = queryset.none()
         elif municipality_code and province_code:
-            from django.db.models import Q
-            from api.models import Province, Municipality
             # HIERARCHICAL VISIBILITY: Municipality view shows:
             # 1. Municipality-wide announcements (municipality FK matches, barangay='')
             # 2. ALL barangay-specific announcements in this municipality (municipality FK matches, barangay set)
@@ -669,21 +723,12 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
             except (Province.DoesNotExist, Municipality.DoesNotExist):
                 queryset = queryset.none()
         elif municipality_code and not province_code:
-            # Filter by municipality only
-            from api.models import Municipality
-            try:
-                municipality_obj = Municipality.objects.get(psgc_code=municipality_code)
-                queryset = queryset.filter(municipality=municipality_obj)
-            except Municipality.DoesNotExist:
-                queryset = queryset.none()
+            # Filter by municipality only. PSGC codes are unique, so joining
+            # on the code matches the same rows without a separate lookup
+            queryset = queryset.filter(municipality__psgc_code=municipality_code)
         elif province_code and not municipality_code:
             # Filter by province only
-            from api.models import Province
-            try:
-                province_obj = Province.objects.get(psgc_code=province_code)
-                queryset = queryset.filter(province=province_obj)
-            except Province.DoesNotExist:
-                queryset = queryset.none()
+            queryset = queryset.filter(province__psgc_code=province_code)
 
         return queryset
 
@@ -695,6 +740,6 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         """Get announcements created by the current user"""
         queryset = Announcement.objects.filter(
             author=request.user
-        ).order_by('-created_at')
+        ).select_related(*ANNOUNCEMENT_LIST_RELATED).order_by('-created_at')
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
@@ -14,7 +14,8 @@ from .permissions import IsProvinceModerator, IsProvinceModeratorForObject
 from .serializers import (
     ListingListSerializer, ListingSerializer,
     AnnouncementListSerializer, AnnouncementSerializer,
-    PublicUserSerializer
+    PublicUserSerializer, LISTING_LIST_RELATED, annotate_is_favorited,
+    first_image_prefetch, ANNOUNCEMENT_LIST_RELATED
 )
 
 
@@ -148,9 +149,11 @@ def mod_listings_list(request):
             status=status.HTTP_403_FORBIDDEN
         )
 
-    queryset = Listing.objects.filter(province=province).select_related(
-        'seller', 'category', 'province', 'municipality', 'barangay'
-    ).prefetch_related('images').order_by('-created_at')
+    queryset = annotate_is_favorited(
+        Listing.objects.filter(province=province), request.user
+    ).select_related(
+        *LISTING_LIST_RELATED
+    ).prefetch_related(first_image_prefetch()).order_by('-created_at')
 
     # Filter by status
     status_filter = request.query_params.get('status')
@@ -210,7 +213,9 @@ def mod_listing_update_status(request, pk):
     listing.status = new_status
     listing.save(update_fields=['status', 'updated_at'])
 
-    serializer = ListingSerializer(listing, context={'request': request})
+    serializer = ListingSerializer(
+        listing, include=ListingSerializer.optional_fields, context={'request': request}
+    )
     return Response(serializer.data)
 
 
@@ -258,7 +263,7 @@ def mod_announcements_list(request):
         )
 
     queryset = Announcement.objects.filter(province=province).select_related(
-        'author', 'province', 'municipality', 'barangay'
+        *ANNOUNCEMENT_LIST_RELATED
     ).order_by('-created_at')
 
     # Filter by active status
@@ -38,3 +38,17 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
+
+# Disable default throttling in tests. The locmem cache outlives individual
+# tests, so the strict auth rates would otherwise start returning 429s partway
+# through the suite. Custom throttle classes still need the rates defined.
+REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = []
+REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
+    'anon': '10000/hour',
+    'user': '10000/hour',
+    'auth': '10000/minute',
+    'password_reset': '10000/hour',
+}
+
+# Keep sent mail (e.g. allauth confirmation emails) in memory
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
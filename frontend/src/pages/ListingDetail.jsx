@@ -42,7 +42,7 @@ const ListingDetail = () => {
 
   const fetchListing = async () => {
     try {
-      const response = await listingsAPI.getById(id);
+      const response = await listingsAPI.getById(id, { include: 'barangay_details' });
       setListing(response.data);
       setIsFavorited(response.data.is_favorited || false);
     } catch (error) {
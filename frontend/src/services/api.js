@@ -142,7 +142,7 @@ export const categoriesAPI = {
 // Listings API
 export const listingsAPI = {
   getAll: (params) => api.get('/api/listings/', { params }),
-  getById: (id) => api.get(`/api/listings/${id}/`),
+  getById: (id, params) => api.get(`/api/listings/${id}/`, { params }),
   create: (formData) => {
     return api.post('/api/listings/', formData, {
       headers: {